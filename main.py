@@ -23,13 +23,13 @@ SOFTWARE.
 import pygame
 import sys
 import random
-from src.settings import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, MUTE, ROTATE_SOUND, BREAK_LINE_SOUND, GAME_OVER_SOUND, WHITE
+from src.settings import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, SIM_STEP, MAX_SIM_STEPS, PAUSED_WAIT, MENU_COLOR_INTERVAL, MUTE, SOUND_VOLUME, ROTATE_SOUND, BREAK_LINE_SOUND, GAME_OVER_SOUND, WHITE
 from src.game_logic import GameLogic
 from src.display import Display
 from src.input_handler import InputHandler
 from src import HighscoreManager
 
-def show_menu(screen, break_line_sound, game_over_sound, rotate_sound):
+def show_menu(screen, break_line_sound, game_over_sound, rotate_sound, highscore_manager):
     """
     Display the main menu and handle menu interactions.
     
@@ -38,12 +38,31 @@ def show_menu(screen, break_line_sound, game_over_sound, rotate_sound):
         break_line_sound (pygame.mixer.Sound): Sound effect for line clearing.
         game_over_sound (pygame.mixer.Sound): Sound effect for game over.
         rotate_sound (pygame.mixer.Sound): Sound effect for tetrimino rotation.
+        highscore_manager (HighscoreManager): Keeps track of the highscore across games.
     """
     menu_running = True
     font = pygame.font.Font(None, 36)
-    highscore_manager = HighscoreManager()
     highscore = highscore_manager.get_highscore()
 
+    # Menu text is static, so render it once up front
+    start_text = font.render('Press S to Start', True, (255, 255, 255)).convert_alpha()
+    quit_text = font.render('Press Q to Quit', True, (255, 255, 255)).convert_alpha()
+    start_text_rect = start_text.get_rect(center=(SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2 - 25))
+    quit_text_rect = quit_text.get_rect(center=(SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2 + 25))
+
+    # Highscore is displayed with each letter in different colors
+    highscore_text = f"Highscore: {highscore}"
+    x_start = SCREEN_WIDTH / 2 - font.size(highscore_text)[0] / 2  # Center the text
+    y_start = SCREEN_HEIGHT / 2 - 150
+    chars = list(highscore_text)
+    char_positions = []
+    for char in chars:
+        char_positions.append((x_start, y_start))
+        x_start += font.size(char)[0]  # Move x_start to the right by the width of the character
+    rendered_chars = []
+    clock = pygame.time.Clock()
+    color_elapsed = MENU_COLOR_INTERVAL  # Color the letters on the first frame
+
     while menu_running:
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
@@ -59,32 +78,44 @@ def show_menu(screen, break_line_sound, game_over_sound, rotate_sound):
         screen.fill((0, 0, 0))  # Clear screen
         
         # Display Menu Text
-        start_text = font.render('Press S to Start', True, (255, 255, 255))
-        quit_text = font.render('Press Q to Quit', True, (255, 255, 255))
-        highscore_text = f"Highscore: {highscore}"
-        
-        start_text_rect = start_text.get_rect(center=(SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2 - 25))
-        quit_text_rect = quit_text.get_rect(center=(SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2 + 25))
         screen.blit(start_text, start_text_rect)
         screen.blit(quit_text, quit_text_rect)
         
-        # Display highscore with each letter in different colors
-        highscore_text = f"Highscore: {highscore}"
-        x_start = SCREEN_WIDTH / 2 - font.size(highscore_text)[0] / 2  # Center the text
-        y_start = SCREEN_HEIGHT / 2 - 150
-        for char in highscore_text:
-            color = (random.randint(0, 255), random.randint(0, 255), random.randint(0, 255))
-            rendered_char = font.render(char, True, color)
-            char_rect = rendered_char.get_rect(left=x_start, top=y_start)
-            screen.blit(rendered_char, char_rect)
-            x_start += font.size(char)[0]  # Move x_start to the right by the width of the character
+        # Re-color the highscore letters only every MENU_COLOR_INTERVAL milliseconds.
+        # The clock also caps the menu at FPS, and unlike get_ticks() it runs without the timer subsystem.
+        color_elapsed += clock.tick(FPS)
+        if color_elapsed >= MENU_COLOR_INTERVAL:
+            rendered_chars = [font.render(char, True, (random.randint(0, 255), random.randint(0, 255), random.randint(0, 255)))
+                              for char in chars]
+            color_elapsed = 0
+        for rendered_char, position in zip(rendered_chars, char_positions):
+            screen.blit(rendered_char, position)
 
         pygame.display.flip()
 
     # Transition to game if menu loop exits
-    main_game(screen, break_line_sound, game_over_sound, rotate_sound)
+    main_game(screen, break_line_sound, game_over_sound, rotate_sound, highscore_manager)
 
-def main_game(screen, break_line_sound, game_over_sound, rotate_sound):
+def handle_events(input_handler, game_logic, display):
+    """
+    Process all pending pygame events, quitting the game when the window is closed.
+
+    Args:
+        input_handler (InputHandler): The handler translating events into game commands.
+        game_logic (GameLogic): The running game, marked dirty when the window needs repainting.
+        display (Display): The game display, fully redrawn when the window needs repainting.
+    """
+    for event in pygame.event.get():
+        if event.type == pygame.QUIT:
+            pygame.quit()
+            sys.exit()
+        if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+            # The window contents were lost, so repaint everything even if the game is paused
+            display.invalidate()
+            game_logic.dirty = True
+        input_handler.process_event(event)
+
+def main_game(screen, break_line_sound, game_over_sound, rotate_sound, highscore_manager):
     """
     Manage the main game loop and gameplay interactions.
 
@@ -93,58 +124,84 @@ def main_game(screen, break_line_sound, game_over_sound, rotate_sound):
         break_line_sound (pygame.mixer.Sound): Sound effect for line clearing.
         game_over_sound (pygame.mixer.Sound): Sound effect for game over.
         rotate_sound (pygame.mixer.Sound): Sound effect for tetrimino rotation.
+        highscore_manager (HighscoreManager): Keeps track of the highscore across games.
     """
     clock = pygame.time.Clock()
     game_logic = GameLogic(break_line_sound, rotate_sound)
     display = Display(screen)
     input_handler = InputHandler(game_logic)
-    highscore_manager = HighscoreManager()
 
+    accumulator = 0
     running = True
     while running:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-            input_handler.process_event(event)
-
-        # Update and render game state
-        if not game_logic.is_paused:
-            game_logic.update(input_handler.commands)
-            display.render(game_logic.grid, game_logic.score, game_logic.current_tetrimino, game_logic.level, game_logic.is_paused)
-        else:
-            display.render(game_logic.grid, game_logic.score, game_logic.current_tetrimino, game_logic.level, game_logic.is_paused)
+        # Simulate in fixed steps, catching up on at most MAX_SIM_STEPS per frame
+        accumulator = min(accumulator + clock.tick(FPS), SIM_STEP * MAX_SIM_STEPS)
+
+        handle_events(input_handler, game_logic, display)
+        while accumulator >= SIM_STEP:
+            if not game_logic.is_paused:
+                game_logic.update(SIM_STEP, input_handler.commands)
+            accumulator -= SIM_STEP
+        handle_events(input_handler, game_logic, display)  # Pick up input that arrived while simulating
+
+        # Render game state, skipping frames where nothing changed
+        dirty_rects = []
+        if game_logic.dirty:
+            dirty_rects = display.render(game_logic.grid, game_logic.score, game_logic.current_tetrimino, game_logic.level, game_logic.is_paused)
+            game_logic.dirty = False
 
         # Handle game over sequence
         if game_logic.check_game_over():
-            game_over_sound.play()
+            if game_over_sound:
+                game_over_sound.play()
             display.show_game_over()
             highscore_manager.update_highscore(game_logic.score)
             running = False  # Stop the game loop if game is over
 
-        pygame.display.flip()
-        clock.tick(FPS)  # Maintain the frame rate
+        if dirty_rects:
+            pygame.display.update(dirty_rects)  # Only push the changed areas to the screen
+        if game_logic.is_paused and not game_logic.dirty:
+            pygame.time.wait(PAUSED_WAIT)  # Nothing changes while paused, so poll input less often
 
     # Return to menu after game over
-    show_menu(screen, break_line_sound, game_over_sound, rotate_sound)
+    show_menu(screen, break_line_sound, game_over_sound, rotate_sound, highscore_manager)
+
+def load_sounds():
+    """
+    Load and decode every sound effect up front, so playing one never stalls the game loop.
+
+    Returns:
+        tuple of pygame.mixer.Sound: The line clearing, game over and rotation sound effects.
+    """
+    sounds = tuple(pygame.mixer.Sound(path) for path in (BREAK_LINE_SOUND, GAME_OVER_SOUND, ROTATE_SOUND))
+    for sound in sounds:
+        sound.set_volume(SOUND_VOLUME)
+    return sounds
 
 def main():
     """
     Initialize the game and create the main window.
     """
-    pygame.init()
-    pygame.mixer.init()
-    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    # Only initialize the pygame modules the game uses, skipping audio entirely when muted
+    pygame.display.init()
+    pygame.font.init()
+    if not MUTE:
+        pygame.mixer.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.DOUBLEBUF | pygame.HWSURFACE)
     pygame.display.set_caption('Tetris')
+
+    # Only queue the events the game reacts to, so mouse and other window events never reach the loops
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN, pygame.KEYUP, pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED])
     
     # Load sounds if not muted
     break_line_sound = game_over_sound = rotate_sound = None
     if not MUTE:
-        break_line_sound = pygame.mixer.Sound(BREAK_LINE_SOUND)
-        game_over_sound = pygame.mixer.Sound(GAME_OVER_SOUND)
-        rotate_sound = pygame.mixer.Sound(ROTATE_SOUND)
+        break_line_sound, game_over_sound, rotate_sound = load_sounds()
 
-    show_menu(screen, break_line_sound, game_over_sound, rotate_sound)
+    # A single manager is shared by the menu and every game, so the file is only read once
+    highscore_manager = HighscoreManager()
+    show_menu(screen, break_line_sound, game_over_sound, rotate_sound, highscore_manager)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -21,7 +21,7 @@ SOFTWARE.
 """
 
 import pygame
-from . import settings
+from .settings import SCREEN_WIDTH, SCREEN_HEIGHT, CELL_SIZE, GRID_WIDTH, GRID_HEIGHT, BLACK, GREY, WHITE, COLORS, HUD_ANTIALIAS
 
 class Display:
     """Handles the graphical display of the Tetris game state on a pygame window.
@@ -30,7 +30,15 @@ class Display:
         screen (pygame.Surface): The primary display surface where the game is drawn.
         font (pygame.font.Font): The font used for rendering text in the game.
         cell_size (int): The size of each grid cell, derived from the settings.
+        bg (pygame.Surface): Pre-rendered empty grid, blitted once per frame instead of drawing every cell.
+        cell_rects (list of list of pygame.Rect): Cached rectangle for every grid cell, indexed [row][column].
+        cell_surfs (list of pygame.Surface): Pre-rendered bordered locked block for each color in settings.COLORS.
+        piece_colors (list of pygame.Color): The settings.COLORS as pygame colors, used to fill the active tetrimino.
+        paused_text (pygame.Surface): Pre-rendered "Paused" text.
+        game_over_text (pygame.Surface): Pre-rendered "Game Over!" text.
     """
+    TEXT_CACHE_SIZE = 256  # Maximum number of rendered score/level texts kept per cache
+
     def __init__(self, screen):
         """
         Initialize the display with a specific pygame screen.
@@ -40,11 +48,74 @@ class Display:
         """
         self.screen = screen
         self.font = pygame.font.Font(None, 36)
-        self.cell_size = settings.CELL_SIZE
-        
+        self.cell_size = CELL_SIZE
+        self.cell_rects = [[pygame.Rect(x * self.cell_size, y * self.cell_size, self.cell_size, self.cell_size)
+                            for x in range(GRID_WIDTH)]
+                           for y in range(GRID_HEIGHT)]
+
+        # The empty grid never changes, so draw its borders once up front.
+        # Cached surfaces are converted to the display format so blitting them needs no pixel conversion.
+        self.bg = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        self.bg.fill(BLACK)
+        for row in self.cell_rects:
+            for rect in row:
+                pygame.draw.rect(self.bg, GREY, rect, 1)
+
+        # Blocks are blitted from pre-rendered surfaces rather than drawn as rectangles
+        self.cell_surfs = [self._make_cell(color) for color in COLORS]
+        self.piece_colors = [pygame.Color(color) for color in COLORS]
+
+        # Text only needs to be rasterized when its value changes
+        self._score_cache = {}
+        self._level_cache = {}
+        self.paused_text = self.font.render("Paused", True, WHITE).convert_alpha()
+        self.game_over_text = self.font.render("Game Over!", True, WHITE).convert_alpha()
+
+        # State of the previous frame, used to only redraw what changed
+        self._prev_frame = None
+        self._prev_hud = None
+
+    def _make_cell(self, color):
+        """
+        Render a single locked grid block with its grey border.
+
+        Args:
+            color (tuple): RGB color of the block.
+
+        Returns:
+            pygame.Surface: The rendered block, the size of one grid cell.
+        """
+        surface = pygame.Surface((self.cell_size, self.cell_size)).convert()
+        surface.fill(color)
+        pygame.draw.rect(surface, GREY, surface.get_rect(), 1)
+        return surface
+
+    def _render_cached(self, cache, value, label):
+        """
+        Return the rendered text for a value, rasterizing it only on a cache miss.
+
+        Args:
+            cache (dict): The cache of rendered surfaces, keyed by value.
+            value (int): The value to display.
+            label (str): The text shown in front of the value.
+
+        Returns:
+            pygame.Surface: The rendered text.
+        """
+        surface = cache.get(value)
+        if surface is None:
+            surface = self.font.render(f"{label}: {value}", HUD_ANTIALIAS, WHITE).convert_alpha()
+            if len(cache) >= self.TEXT_CACHE_SIZE:
+                del cache[next(iter(cache))]  # Evict the oldest entry
+            cache[value] = surface
+        return surface
+
     def render(self, grid, score, current_tetrimino, level, is_paused):
         """
-        Render the entire game screen, including the grid, active tetrimino, score, and level.
+        Render the game screen, including the grid, active tetrimino, score, and level.
+
+        Only the cells that changed since the previous frame are redrawn. The whole screen
+        is redrawn on the first frame and whenever the score, level or pause state changes.
 
         Args:
             grid (list of list of int): The game grid represented as a 2D array.
@@ -52,54 +123,160 @@ class Display:
             current_tetrimino (Tetrimino): The currently active tetrimino object.
             level (int): Current level of the game.
             is_paused (bool): True if the game is paused, False otherwise.
+
+        Returns:
+            list of pygame.Rect: The areas of the screen that were redrawn and need to be updated.
+        """
+        # Compose what each cell shows: locked blocks are positive, the active tetrimino negative
+        frame = [row[:] for row in grid]
+        if current_tetrimino:
+            row, col = current_tetrimino.row, current_tetrimino.col
+            for i, j, val in current_tetrimino.get_current_cells():
+                frame[row + i][col + j] = -val
+
+        score_text = self._render_cached(self._score_cache, score, "Score")
+        level_text = self._render_cached(self._level_cache, level, "Level")
+        overlays = [(score_text, (CELL_SIZE, CELL_SIZE)),  # Margin from top-left corner
+                    (level_text, (CELL_SIZE, CELL_SIZE * 2))]  # Slightly below the score
+        if is_paused:
+            overlays.append((self.paused_text, self.paused_text.get_rect(
+                center=(self.screen.get_width() / 2, self.screen.get_height() / 2)).topleft))
+
+        hud = (score, level, is_paused)
+        if self._prev_frame is None or hud != self._prev_hud:
+            dirty = self._render_full(frame, overlays)
+        else:
+            dirty = self._render_changes(frame, overlays)
+        self._prev_frame = frame
+        self._prev_hud = hud
+        return dirty
+
+    def _render_full(self, frame, overlays):
+        """
+        Redraw the whole screen.
+
+        Args:
+            frame (list of list of int): The cell values to draw, negative for the active tetrimino.
+            overlays (list of tuple): The text surfaces and their top-left positions, drawn on top of the grid.
+
+        Returns:
+            list of pygame.Rect: The full screen area.
         """
-        self.screen.fill(settings.BLACK)  # Clear the screen each frame.
+        self.screen.blit(self.bg, (0, 0))  # Clear the screen to the empty grid.
 
-        # Draw the grid cells
-        for y, row in enumerate(grid):
-            for x, cell in enumerate(row):
-                rect = pygame.Rect(x * self.cell_size, y * self.cell_size, self.cell_size, self.cell_size)
+        # Draw the occupied cells
+        for y, row in enumerate(frame):
+            rects = self.cell_rects[y]
+            for start, end, cell in self._runs(row):
                 if cell:
-                    pygame.draw.rect(self.screen, settings.COLORS[cell - 1], rect)
-                pygame.draw.rect(self.screen, settings.GREY, rect, 1)
+                    self._draw_run(cell, rects[start], rects[end - 1])
 
-        # Draw the current tetrimino
-        if current_tetrimino:
-            shape = current_tetrimino.get_current_shape()
-            for i, row in enumerate(shape):
-                for j, val in enumerate(row):
-                    if val:
-                        color = settings.COLORS[val - 1]
-                        px = (current_tetrimino.position[1] + j) * self.cell_size
-                        py = (current_tetrimino.position[0] + i) * self.cell_size
-                        pygame.draw.rect(self.screen, color, pygame.Rect(px, py, self.cell_size, self.cell_size))
-
-        # Display score and level at specified positions
-        score_text = self.font.render(f"Score: {score}", True, settings.WHITE)
-        self.screen.blit(score_text, (settings.CELL_SIZE, settings.CELL_SIZE))  # Margin from top-left corner
-        level_text = self.font.render(f"Level: {level}", True, settings.WHITE)
-        self.screen.blit(level_text, (settings.CELL_SIZE, settings.CELL_SIZE * 2))  # Slightly below the score
-        
-        # Handle paused state display
-        if is_paused:
-            paused_text = self.font.render("Paused", True, (255, 255, 255))
-            text_rect = paused_text.get_rect(center=(self.screen.get_width() / 2, self.screen.get_height() / 2))
-            self.screen.blit(paused_text, text_rect)
+        for surface, position in overlays:
+            self.screen.blit(surface, position)
+        return [self.screen.get_rect()]
+
+    def _render_changes(self, frame, overlays):
+        """
+        Redraw only the cells that differ from the previous frame.
+
+        Args:
+            frame (list of list of int): The cell values to draw, negative for the active tetrimino.
+            overlays (list of tuple): The text surfaces and their top-left positions, drawn on top of the grid.
+
+        Returns:
+            list of pygame.Rect: The redrawn areas.
+        """
+        dirty = []
+        for y, (row, prev_row) in enumerate(zip(frame, self._prev_frame)):
+            if row == prev_row:
+                continue
+            rects = self.cell_rects[y]
+            for start, end, cell in self._runs(row, prev_row):
+                dirty.append(self._draw_run(cell, rects[start], rects[end - 1]))
+
+        # Repaint the parts of the texts that were drawn over
+        for surface, position in overlays:
+            overlay_rect = surface.get_rect(topleft=position)
+            for rect in dirty:
+                if rect.colliderect(overlay_rect):
+                    self.screen.blit(surface, rect, rect.move(-position[0], -position[1]))
+        return dirty
+
+    @staticmethod
+    def _runs(row, prev_row=None):
+        """
+        Group the cells of a frame row that need drawing into horizontal runs.
+
+        Adjacent empty cells or adjacent cells of the active tetrimino with the same value
+        are merged into one run, as they can be drawn with a single call. Locked blocks have
+        their own border, so each forms a run of its own.
+
+        Args:
+            row (list of int): The cell values of the row.
+            prev_row (list of int, optional): The same row of the previous frame. When given,
+                only the cells that changed are included.
+
+        Returns:
+            list of tuple: The (start column, end column exclusive, cell value) of each run.
+        """
+        runs = []
+        width = len(row)
+        x = 0
+        while x < width:
+            cell = row[x]
+            if prev_row is not None and cell == prev_row[x]:
+                x += 1
+                continue
+            end = x + 1
+            if cell <= 0:
+                while end < width and row[end] == cell and (prev_row is None or prev_row[end] != cell):
+                    end += 1
+            runs.append((x, end, cell))
+            x = end
+        return runs
+
+    def _draw_run(self, cell, first_rect, last_rect):
+        """
+        Draw a horizontal run of cells sharing the same value.
+
+        Args:
+            cell (int): The cell value, positive for a locked block, zero for an empty cell and
+                negative for the active tetrimino.
+            first_rect (pygame.Rect): The screen area of the first cell of the run.
+            last_rect (pygame.Rect): The screen area of the last cell of the run.
+
+        Returns:
+            pygame.Rect: The screen area that was drawn.
+        """
+        rect = first_rect if first_rect is last_rect else first_rect.union(last_rect)
+        if cell > 0:
+            self.screen.blit(self.cell_surfs[cell - 1], rect)
+        elif cell == 0:
+            self.screen.blit(self.bg, rect, rect)  # Restore the empty grid
+        else:
+            self.screen.fill(self.piece_colors[-cell - 1], rect)  # The active tetrimino has no border
+        return rect
+
+    def invalidate(self):
+        """
+        Forget the previous frame, so the next render redraws the whole screen.
+
+        Used when the window contents were lost, e.g. after the window was covered or restored.
+        """
+        self._prev_frame = None
 
     def show_paused(self):
         """
         Display the paused state overlay.
         """
-        paused_text = self.font.render("Paused", True, settings.WHITE)
-        text_rect = paused_text.get_rect(center=(self.screen.get_width() / 2, self.screen.get_height() / 2))
-        self.screen.blit(paused_text, text_rect)
+        text_rect = self.paused_text.get_rect(center=(self.screen.get_width() / 2, self.screen.get_height() / 2))
+        self.screen.blit(self.paused_text, text_rect)
 
     def show_game_over(self):
         """
         Display the game over screen.
         """
-        game_over_text = self.font.render("Game Over!", True, settings.WHITE)
-        text_rect = game_over_text.get_rect(center=(settings.SCREEN_WIDTH / 2, settings.SCREEN_HEIGHT / 2))
-        self.screen.blit(game_over_text, text_rect)
+        text_rect = self.game_over_text.get_rect(center=(SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2))
+        self.screen.blit(self.game_over_text, text_rect)
         pygame.display.flip() # Update the full display Surface to the screen
         pygame.time.wait(2000)  # Pause the display for 2 seconds to show game over text
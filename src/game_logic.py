@@ -21,9 +21,11 @@ SOFTWARE.
 """
 
 import random
-import pygame
 from .tetrimino import Tetrimino
-from . import settings
+from .input_handler import MOVE_LEFT, MOVE_RIGHT, MOVE_DOWN, ROTATE
+from .settings import GRID_WIDTH, GRID_HEIGHT, FULL_ROW_MASK, LEVEL_CHANGE_LINES, LEVEL_SPEED_INCREMENT, SHAPE_NAMES
+
+TETRIMINO_TYPES = tuple(range(len(SHAPE_NAMES)))  # Integer shape ids, so spawning needs no name lookups
 
 class GameLogic:
     """Main class for handling the logic of the Tetris game, managing game states, and responding to player actions.
@@ -32,19 +34,22 @@ class GameLogic:
         break_line_sound (pygame.mixer.Sound): Sound played when a line is cleared.
         rotate_sound (pygame.mixer.Sound): Sound played when a tetrimino is rotated.
         grid (list of list of int): Representation of the game grid.
+        row_masks (list of int): Occupancy bitmask of each grid row, kept in sync with grid.
+        bag (list of int): Tetrimino shape ids left to spawn before the bag is refilled and reshuffled.
         score (int): Current score of the player.
         lines_cleared (int): Total number of lines cleared.
         level (int): Current level of the game.
         current_tetrimino (Tetrimino): The currently active tetrimino.
         game_over (bool): Flag indicating if the game has ended.
         is_paused (bool): Flag indicating if the game is paused.
+        dirty (bool): Flag indicating the game state changed since it was last rendered.
         drop_speed (int): Time in milliseconds between automatic drops of the tetrimino.
         soft_drop_speed (int): Time in milliseconds for quicker drops when moving down is held.
         move_speed (int): Time in milliseconds between lateral movements when arrow keys are held.
         rotation_delay (int): Time in milliseconds between rotations.
-        last_drop_time (int): Last recorded time when a tetrimino was dropped.
-        last_move_time (int): Last recorded time when a tetrimino was moved laterally.
-        last_rotation_time (int): Last recorded time when a tetrimino was rotated.
+        drop_elapsed (int): Time in milliseconds since the tetrimino last dropped.
+        move_cooldown (int): Time in milliseconds until the tetrimino can next move laterally.
+        rotation_cooldown (int): Time in milliseconds until the tetrimino can next rotate.
     """
     def __init__(self, break_line_sound, rotate_sound):
         """
@@ -52,26 +57,30 @@ class GameLogic:
         """
         self.rotate_sound = rotate_sound
         self.break_line_sound = break_line_sound
-        self.grid = [[0]*settings.GRID_WIDTH for _ in range(settings.GRID_HEIGHT)]
+        self.grid = [[0]*GRID_WIDTH for _ in range(GRID_HEIGHT)]
+        self.row_masks = [0] * GRID_HEIGHT
+        self.bag = []
         self.score = 0
         self.lines_cleared = 0
         self.level = 1
         self.current_tetrimino = self.new_tetrimino()
         self.game_over = False
         self.is_paused = False
+        self.dirty = True
         self.drop_speed = 1000
         self.soft_drop_speed = 50
         self.move_speed = 100
         self.rotation_delay = 200
-        self.last_drop_time = pygame.time.get_ticks()
-        self.last_move_time = pygame.time.get_ticks()
-        self.last_rotation_time = pygame.time.get_ticks()
+        self.drop_elapsed = 0  # Counts up, as gravity and soft drop compare it to different intervals
+        self.move_cooldown = self.move_speed
+        self.rotation_cooldown = self.rotation_delay
 
     def toggle_pause(self):
         """
         Toggles the pause state of the game.
         """
         self.is_paused = not self.is_paused
+        self.dirty = True
         return self.is_paused
 
     def reset_game(self):
@@ -84,12 +93,13 @@ class GameLogic:
         self.current_tetrimino = self.new_tetrimino()
         self.game_over = False
         self.is_paused = False
+        self.dirty = True
 
     def update_level(self):
         """
         Updates the game level based on the number of lines cleared, increasing the difficulty.
         """
-        new_level = 1 + self.lines_cleared // settings.LEVEL_CHANGE_LINES
+        new_level = 1 + self.lines_cleared // LEVEL_CHANGE_LINES
         if new_level > self.level:
             self.level = new_level
             self.adjust_game_speed()
@@ -98,65 +108,81 @@ class GameLogic:
         """
         Adjusts the speed of the game based on the current level, affecting how quickly tetriminos fall.
         """
-        self.drop_speed = max(100, self.drop_speed - settings.LEVEL_SPEED_INCREMENT * (self.level - 1))
+        self.drop_speed = max(100, self.drop_speed - LEVEL_SPEED_INCREMENT * (self.level - 1))
    
     def new_tetrimino(self):
         """
         Create a new tetrimino and place it at the starting position.
+
+        Tetriminos are drawn from a shuffled bag holding one of each type, which is refilled once empty.
         """
-        tetrimino_type = random.choice(list(settings.TETRIMINOS.keys()))
-        tetrimino = Tetrimino(tetrimino_type, self.grid)
+        if not self.bag:
+            self.bag = list(TETRIMINO_TYPES)
+            random.shuffle(self.bag)
+        shape_id = self.bag.pop()
+        tetrimino = Tetrimino(shape_id, self.row_masks)
         if not tetrimino.can_fit(0, 4):
             self.game_over = True
         return tetrimino
     
-    def update(self, commands):
+    def update(self, dt, commands):
         """
-        Main update loop of the game logic, called every frame to process input, drop tetriminos, and check game state.
+        Main update loop of the game logic, called every simulation step to process input, drop tetriminos, and check game state.
+
+        Args:
+            dt (int): Time in milliseconds advanced by this step.
+            commands (int): Bitmask of the currently active player command flags.
         """
         if self.game_over or self.is_paused:
             return
 
-        current_time = pygame.time.get_ticks()
-        self.process_player_input(current_time, commands)
-        self.handle_automatic_drop(current_time, commands)
+        self.process_player_input(dt, commands)
+        self.handle_automatic_drop(dt, commands)
 
-    def process_player_input(self, current_time, commands):
+    def process_player_input(self, dt, commands):
         """
         Processes player inputs for moving and rotating tetriminos.
         """
-        self.handle_moves(current_time, commands)
-        self.handle_rotation(current_time, commands)
+        self.handle_moves(dt, commands)
+        self.handle_rotation(dt, commands)
 
-    def handle_moves(self, current_time, commands):
+    def handle_moves(self, dt, commands):
         """
         Handles horizontal movements based on player commands.
         """
-        if current_time - self.last_move_time > self.move_speed:
-            if 'move_left' in commands and self.current_tetrimino.can_fit(self.current_tetrimino.position[0], self.current_tetrimino.position[1] - 1):
-                self.current_tetrimino.position[1] -= 1
-            if 'move_right' in commands and self.current_tetrimino.can_fit(self.current_tetrimino.position[0], self.current_tetrimino.position[1] + 1):
-                self.current_tetrimino.position[1] += 1
-            self.last_move_time = current_time
+        self.move_cooldown -= dt
+        if self.move_cooldown < 0:
+            tetrimino = self.current_tetrimino
+            if commands & MOVE_LEFT and tetrimino.can_fit(tetrimino.row, tetrimino.col - 1):
+                tetrimino.col -= 1
+                self.dirty = True
+            if commands & MOVE_RIGHT and tetrimino.can_fit(tetrimino.row, tetrimino.col + 1):
+                tetrimino.col += 1
+                self.dirty = True
+            self.move_cooldown = self.move_speed
 
-    def handle_rotation(self, current_time, commands):
+    def handle_rotation(self, dt, commands):
         """
         Handles the rotation of tetriminos based on player commands.
         """
-        if 'rotate' in commands:
-            self.last_rotation_time = self.current_tetrimino.rotate(current_time, self.last_rotation_time, self.rotation_delay, self.rotate_sound)
+        self.rotation_cooldown -= dt
+        if commands & ROTATE and self.rotation_cooldown < 0:
+            if self.current_tetrimino.rotate(self.rotate_sound):
+                self.rotation_cooldown = self.rotation_delay
+                self.dirty = True
 
-    def handle_automatic_drop(self, current_time, commands):
+    def handle_automatic_drop(self, dt, commands):
         """
         Manages the automatic dropping of tetriminos based on the game's drop speed and player's soft drop commands.
         """
-        if 'move_down' in commands:
-            if current_time - self.last_drop_time > self.soft_drop_speed:
-                self.attempt_to_drop(current_time)
-        elif current_time - self.last_drop_time > self.drop_speed:
-            self.attempt_to_drop(current_time)
+        self.drop_elapsed += dt
+        if commands & MOVE_DOWN:
+            if self.drop_elapsed > self.soft_drop_speed:
+                self.attempt_to_drop()
+        elif self.drop_elapsed > self.drop_speed:
+            self.attempt_to_drop()
 
-    def attempt_to_drop(self, current_time):
+    def attempt_to_drop(self):
         """
         Attempts to drop the tetrimino one level; if it cannot drop further, it is placed and the grid is updated.
         """
@@ -164,15 +190,17 @@ class GameLogic:
             self.place_tetrimino()
             self.clear_lines()
             self.current_tetrimino = self.new_tetrimino()
-        self.last_drop_time = current_time
+        self.drop_elapsed = 0
+        self.dirty = True  # The tetrimino either moved down or was placed
 
     def drop_tetrimino(self):
         """
         Drops the current tetrimino by one level if possible, places it if it reaches the bottom or hits another tetrimino.
         """
-        if self.current_tetrimino.can_fit(self.current_tetrimino.position[0] + 1, self.current_tetrimino.position[1]):
-            self.current_tetrimino.position[0] += 1
-            if not self.current_tetrimino.can_fit(self.current_tetrimino.position[0] + 1, self.current_tetrimino.position[1]):
+        tetrimino = self.current_tetrimino
+        if tetrimino.can_fit(tetrimino.row + 1, tetrimino.col):
+            tetrimino.row += 1
+            if not tetrimino.can_fit(tetrimino.row + 1, tetrimino.col):
                 self.place_tetrimino()
                 self.clear_lines()
                 self.update_level()
@@ -186,28 +214,26 @@ class GameLogic:
         """
         Places the current tetrimino onto the grid, marking its cells as occupied.
         """
-        shape = self.current_tetrimino.get_current_shape()
-        for i, row in enumerate(shape):
-            for j, cell in enumerate(row):
-                if cell > 0:
-                    self.grid[self.current_tetrimino.position[0] + i][self.current_tetrimino.position[1] + j] = cell
+        row, col = self.current_tetrimino.row, self.current_tetrimino.col
+        for i, j, cell in self.current_tetrimino.get_current_cells():
+            self.grid[row + i][col + j] = cell
+        for i, mask in self.current_tetrimino.get_current_rows():
+            self.row_masks[row + i] |= mask << col  # Marks every cell of the shape row at once
 
     def clear_lines(self):
         """
         Clears completed lines from the grid, increases the score, and plays a sound effect.
         """
-        cleared_lines = 0
-        new_grid = []
-        for row in self.grid:
-            if 0 in row:
-                new_grid.append(row)
-            else:
-                cleared_lines += 1
-        if cleared_lines > 0:
+        kept_rows = [y for y, mask in enumerate(self.row_masks) if mask != FULL_ROW_MASK]
+        cleared_lines = len(self.row_masks) - len(kept_rows)
+        if cleared_lines == 0:
+            return  # Nothing to clear, so leave the grid untouched
+
+        if self.break_line_sound:
             self.break_line_sound.play()
-            
-        new_grid = [[0]*settings.GRID_WIDTH for _ in range(cleared_lines)] + new_grid
-        self.grid = new_grid
+        # Update the grid in place so references held by the active tetrimino stay valid
+        self.grid[:] = [[0]*GRID_WIDTH for _ in range(cleared_lines)] + [self.grid[y] for y in kept_rows]
+        self.row_masks[:] = [0] * cleared_lines + [self.row_masks[y] for y in kept_rows]
         self.lines_cleared += cleared_lines
         self.score += cleared_lines ** 2
 
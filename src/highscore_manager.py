@@ -25,7 +25,7 @@ class HighscoreManager:
 
     Attributes:
         filename (str): The name of the file where the high score is saved.
-        highscore (int): The highest score achieved that is stored in the file.
+        highscore (int): The highest score achieved that is stored in the file, loaded on first access.
     """
     def __init__(self, filename="highscore.txt"):
         """
@@ -35,7 +35,20 @@ class HighscoreManager:
             filename (str, optional): The file name where the high score is saved. Defaults to "highscore.txt".
         """
         self.filename = filename
-        self.highscore = self.load_highscore()
+        self._highscore = None  # Read from the file on first access
+
+    @property
+    def highscore(self):
+        """
+        The current high score, loaded from the file the first time it is needed.
+        """
+        if self._highscore is None:
+            self._highscore = self.load_highscore()
+        return self._highscore
+
+    @highscore.setter
+    def highscore(self, value):
+        self._highscore = value
 
     def load_highscore(self):
         """ 
@@ -22,13 +22,27 @@ SOFTWARE.
 
 import pygame
 
+# Command flags combined into the InputHandler.commands bitmask
+MOVE_LEFT = 1
+MOVE_RIGHT = 2
+MOVE_DOWN = 4
+ROTATE = 8
+
 class InputHandler:
     """Handles user input and translates it into game commands that affect the game state.
 
     Attributes:
         game_logic (GameLogic): A reference to the game's logic handler to directly affect game state.
-        commands (dict): A dictionary to keep track of active commands based on user input.
+        commands (int): A bitmask of the command flags that are active based on user input.
     """
+    # Held keys and the commands they keep active
+    _KEY_COMMANDS = {
+        pygame.K_LEFT: MOVE_LEFT,
+        pygame.K_RIGHT: MOVE_RIGHT,
+        pygame.K_DOWN: MOVE_DOWN,
+        pygame.K_UP: ROTATE,
+    }
+
     def __init__(self, game_logic):
         """
         Initialize the InputHandler with a reference to the game's logic controller.
@@ -37,7 +51,7 @@ class InputHandler:
             game_logic (GameLogic): The game logic controller which handles game state updates.
         """
         self.game_logic = game_logic  # Pass a reference to the GameLogic object
-        self.commands = {}
+        self.commands = 0
 
     def process_event(self, event):
         """
@@ -48,14 +62,9 @@ class InputHandler:
         """
         if event.type == pygame.KEYDOWN:
             # Handling key press events
-            if event.key == pygame.K_LEFT:
-                self.commands['move_left'] = True
-            elif event.key == pygame.K_RIGHT:
-                self.commands['move_right'] = True
-            elif event.key == pygame.K_DOWN:
-                self.commands['move_down'] = True
-            elif event.key == pygame.K_UP:
-                self.commands['rotate'] = True
+            command = self._KEY_COMMANDS.get(event.key)
+            if command:
+                self.commands |= command
             elif event.key == pygame.K_p:
                 # Toggle pause when 'p' is pressed
                 self.game_logic.toggle_pause()
@@ -65,11 +74,6 @@ class InputHandler:
 
         elif event.type == pygame.KEYUP:
             # Handling key release events
-            if event.key == pygame.K_LEFT:
-                self.commands.pop('move_left', None)
-            elif event.key == pygame.K_RIGHT:
-                self.commands.pop('move_right', None)
-            elif event.key == pygame.K_DOWN:
-                self.commands.pop('move_down', None)
-            elif event.key == pygame.K_UP:
-                self.commands.pop('rotate', None)
\ No newline at end of file
+            command = self._KEY_COMMANDS.get(event.key)
+            if command:
+                self.commands &= ~command
\ No newline at end of file
@@ -9,13 +9,25 @@ Attributes:
     SCREEN_HEIGHT (int): The height of the game screen in pixels.
     CELL_SIZE (int): The size of each cell in the grid, representing individual Tetrimino blocks.
     FPS (int): Frames per second, defining the update rate of the game loop.
+    SIM_STEP (int): Milliseconds of game time advanced by each fixed simulation step.
+    MAX_SIM_STEPS (int): Maximum number of simulation steps run per frame to catch up after a stall.
+    PAUSED_WAIT (int): Milliseconds the game loop sleeps per frame while the game is paused.
+    MENU_COLOR_INTERVAL (int): Milliseconds between color changes of the menu highscore text.
+    HUD_ANTIALIAS (bool): Whether the score and level texts are rendered with antialiasing.
     BLACK, WHITE, GREY, RED, GREEN, BLUE, CYAN, MAGENTA, YELLOW, ORANGE (tuple): RGB color definitions used throughout the game.
     COLORS (list of tuple): A list mapping Tetrimino types to their respective colors.
     GRID_WIDTH (int): The number of cells horizontally across the game grid.
     GRID_HEIGHT (int): The number of cells vertically across the game grid.
+    FULL_ROW_MASK (int): Occupancy bitmask of a grid row with every cell filled.
     LEVEL_CHANGE_LINES (int): The number of lines that need to be cleared to trigger a level increase.
     LEVEL_SPEED_INCREMENT (int): The amount of milliseconds by which the fall speed decreases per level increase.
     TETRIMINOS (dict): Definitions of Tetrimino shapes and their rotations.
+    SHAPE_NAMES (tuple of str): The Tetrimino shape identifiers, indexed by integer shape id.
+    SHAPE_IDS (dict): The integer shape id of each Tetrimino shape identifier.
+    TETRIMINO_TABLE (tuple of dict): The TETRIMINOS definitions, indexed by shape id.
+    SHAPE_TABLE (tuple): Per-rotation lookup tables derived from TETRIMINOS, indexed by shape id, holding the
+        occupied cells, the bitmasks of the occupied shape rows and the bounding box of the occupied cells.
+    FIT_FUNCS (tuple): Generated collision test per rotation, indexed by shape id, with the shape row bitmasks unrolled.
     MUTE (bool): Flag to mute all game sounds.
     SOUND_VOLUME (float): The volume for sound effects.
     MUSIC_VOLUME (float): The volume for background music.
@@ -29,6 +41,11 @@ SCREEN_WIDTH = 400
 SCREEN_HEIGHT = 800  
 CELL_SIZE = 40      # Size of each cell in the grid
 FPS = 60            # Frames per second
+SIM_STEP = 1000 // FPS  # Milliseconds per fixed simulation step
+MAX_SIM_STEPS = 5   # Cap on catch-up steps per frame
+PAUSED_WAIT = 50    # Milliseconds to sleep per frame while paused
+MENU_COLOR_INTERVAL = 100  # Milliseconds between menu highscore color changes
+HUD_ANTIALIAS = False  # Score/level text re-renders on every change, so skip the costlier antialiased path
 
 # Color settings (RGB)
 BLACK = (0, 0, 0)
@@ -56,6 +73,7 @@ COLORS = [
 # Game settings
 GRID_WIDTH = SCREEN_WIDTH // CELL_SIZE
 GRID_HEIGHT = SCREEN_HEIGHT // CELL_SIZE
+FULL_ROW_MASK = (1 << GRID_WIDTH) - 1  # Bit c is set when column c of a row is filled
 LEVEL_CHANGE_LINES = 10  # Number of lines cleared to increase the level
 LEVEL_SPEED_INCREMENT = 10  # Decrease in fall speed (ms) per level increase
 
@@ -89,10 +107,69 @@ TETRIMINOS = {
           'color': ORANGE}
 }
 
+def _build_shape_entry(matrix):
+    """
+    Precompute the lookup data for one Tetrimino rotation matrix.
+
+    Args:
+        matrix (list of list of int): The rotation matrix, non-zero where a block is present.
+
+    Returns:
+        dict: 'cells' holds the (row, column, value) of each block, 'bbox' the
+        (min_row, max_row, min_col, max_col) of the blocks, 'masks' one bitmask per
+        row of the bounding box, with bit 0 corresponding to min_col, and 'rows' the
+        (row, bitmask) of each occupied row, with bit 0 corresponding to column 0.
+    """
+    cells = tuple((i, j, value) for i, line in enumerate(matrix) for j, value in enumerate(line) if value)
+    rows = [i for i, _, _ in cells]
+    cols = [j for _, j, _ in cells]
+    bbox = (min(rows), max(rows), min(cols), max(cols))
+    masks = tuple(sum(1 << (j - bbox[2]) for i, j, _ in cells if i == row) for row in range(bbox[0], bbox[1] + 1))
+    rows = tuple((row, mask << bbox[2]) for row, mask in enumerate(masks, bbox[0]) if mask)
+    return {'masks': masks, 'cells': cells, 'bbox': bbox, 'rows': rows}
+
+def _build_fit_function(entry):
+    """
+    Generate a collision test specialized for one Tetrimino rotation.
+
+    The shape row bitmasks are unrolled into the function body as constants, so a call
+    performs only the grid reads and ANDs for that rotation. Bounds are not checked.
+
+    Args:
+        entry (dict): The lookup data of the rotation, as built by _build_shape_entry.
+
+    Returns:
+        function: fit(grid, row, col), True if the rotation overlaps no occupied cell of the
+        grid row bitmasks when placed with its matrix at (row, col).
+    """
+    min_row, _, min_col, _ = entry['bbox']
+    shift = f"(col + {min_col})" if min_col else "col"
+    tests = [f"grid[row + {i}] & ({mask} << {shift})" if i else f"grid[row] & ({mask} << {shift})"
+             for i, mask in enumerate(entry['masks'], min_row) if mask]
+    source = f"def fit(grid, row, col):\n    return not ({' or '.join(tests)})\n"
+    namespace = {}
+    exec(source, namespace)
+    return namespace['fit']
+
+# Integer shape ids, so hot paths index tuples instead of hashing shape names
+SHAPE_NAMES = tuple(TETRIMINOS)
+SHAPE_IDS = {shape: shape_id for shape_id, shape in enumerate(SHAPE_NAMES)}
+TETRIMINO_TABLE = tuple(TETRIMINOS[shape] for shape in SHAPE_NAMES)
+
+# Precomputed lookup tables, indexed by shape id and rotation
+SHAPE_TABLE = tuple(
+    tuple(_build_shape_entry(matrix) for matrix, _ in tetrimino['rotations'])
+    for tetrimino in TETRIMINO_TABLE
+)
+FIT_FUNCS = tuple(
+    tuple(_build_fit_function(entry) for entry in entries)
+    for entries in SHAPE_TABLE
+)
+
 # Sound settings
 MUTE = False
 SOUND_VOLUME = 0.5
 MUSIC_VOLUME = 0.5
-BREAK_LINE_SOUND = 'assets/sounds/line_break.mp3'
-GAME_OVER_SOUND = 'assets/sounds/game_over.mp3'
-ROTATE_SOUND = 'assets/sounds/rotate_block.mp3'
+BREAK_LINE_SOUND = 'assets/sounds/line_break.wav'
+GAME_OVER_SOUND = 'assets/sounds/game_over.wav'
+ROTATE_SOUND = 'assets/sounds/rotate_block.wav'
@@ -20,58 +20,81 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
-from . import settings
+from .settings import GRID_WIDTH, SHAPE_NAMES, SHAPE_IDS, TETRIMINO_TABLE, SHAPE_TABLE, FIT_FUNCS
 
 class Tetrimino:
     """Represents a Tetris piece, capable of rotating and checking its fit within the game grid.
 
     Attributes:
         shape (str): Identifier for the Tetrimino shape.
+        shape_id (int): Integer id of the Tetrimino shape, indexing the settings lookup tables.
         rotation (int): Current rotation index of the Tetrimino.
-        grid (list of list of int): The game grid in which the Tetrimino is placed.
-        position (list of int): The starting position [row, column] of the Tetrimino on the grid.
+        grid (list of int): The game grid in which the Tetrimino is placed, as one occupancy bitmask per row.
+        row (int): The grid row of the top of the Tetrimino's rotation matrix.
+        col (int): The grid column of the left of the Tetrimino's rotation matrix.
         rotate_sound (pygame.mixer.Sound): Sound to play when the Tetrimino rotates.
         rotations (list): A list of rotations where each rotation is defined by a matrix of block positions.
         color (tuple): RGB color value for the Tetrimino.
+        shape_table (tuple of dict): Precomputed cells, row bitmasks and bounding box of each rotation.
     """
+    # Fixed attributes avoid a per-instance __dict__ and make the hot attribute reads cheaper
+    __slots__ = ('shape', 'shape_id', 'rotation', 'grid', 'row', 'col', 'rotate_sound', 'rotations', 'color',
+                 'shape_table', '_fit', '_bounds', '_height', '_width', '_shape', '_cells', '_rows')
+
     def __init__(self, shape, grid, rotate_sound=None):
         """
         Initializes a new instance of a Tetrimino.
 
         Args:
-            shape (str): The shape identifier for the Tetrimino.
-            grid (list of list of int): Reference to the game's grid.
+            shape (str or int): The shape identifier or integer shape id for the Tetrimino.
+            grid (list of int): Reference to the game's grid row bitmasks, bit c set when column c is filled.
             rotate_sound (pygame.mixer.Sound, optional): Sound effect for rotation.
         """
-        self.shape = shape
+        if isinstance(shape, str):
+            shape = SHAPE_IDS[shape]
+        self.shape_id = shape
+        self.shape = SHAPE_NAMES[shape]
         self.rotation = 0
         self.grid = grid
-        self.position = [0, 4]
+        self.row = 0
+        self.col = 4
         self.rotate_sound = rotate_sound
-        self.rotations = settings.TETRIMINOS[self.shape]['rotations']
-        self.color = settings.TETRIMINOS[self.shape]['color']
+        tetrimino = TETRIMINO_TABLE[shape]
+        self.rotations = tetrimino['rotations']
+        self.color = tetrimino['color']
+        self.shape_table = SHAPE_TABLE[shape]
+        self._fit = FIT_FUNCS[shape]
+        self._bounds = tuple(entry['bbox'] for entry in self.shape_table)  # Indexed by rotation, no dict lookups in can_fit
+        self._height = len(grid)  # The grid is updated in place, so its size never changes
+        self._width = GRID_WIDTH
+        self._update_current_shape()
 
-    def rotate(self, current_time, last_rotation_time, rotation_delay, rotate_sound):
+    def rotate(self, rotate_sound=None):
         """
-        Rotate the Tetrimino if the rotation delay has been met.
+        Rotate the Tetrimino to its next rotation if it fits in the grid.
 
         Args:
-            current_time (int): The current time in milliseconds.
-            last_rotation_time (int): The last time the Tetrimino was rotated.
-            rotation_delay (int): The minimum delay required between rotations.
-            rotate_sound (pygame.mixer.Sound): Sound to play upon rotation.
+            rotate_sound (pygame.mixer.Sound, optional): Sound to play upon rotation.
 
         Returns:
-            int: The updated last rotation time.
+            bool: True if the Tetrimino was rotated, False otherwise.
+        """
+        next_rotation = (self.rotation + 1) % len(self.rotations)
+        if not self.can_fit(self.row, self.col, next_rotation):
+            return False
+        self.rotation = next_rotation
+        self._update_current_shape()
+        if rotate_sound:
+            rotate_sound.play()
+        return True
+
+    def _update_current_shape(self):
         """
-        if current_time - last_rotation_time > rotation_delay:
-            next_rotation = (self.rotation + 1) % len(self.rotations)
-            if self.can_fit(self.position[0], self.position[1], next_rotation):
-                self.rotation = next_rotation
-                if rotate_sound:
-                    rotate_sound.play()
-                return current_time
-        return last_rotation_time
+        Cache the matrix and occupied cells of the current rotation, called whenever the rotation changes.
+        """
+        self._shape = self.rotations[self.rotation][0]
+        self._cells = self.shape_table[self.rotation]['cells']
+        self._rows = self.shape_table[self.rotation]['rows']
 
     def can_fit(self, row, col, rotation=None):
         """
@@ -87,14 +110,11 @@ class Tetrimino:
         """
         if rotation is None:
             rotation = self.rotation
-        shape = self.rotations[rotation][0]
-        for i, line in enumerate(shape):
-            for j, cell in enumerate(line):
-                if cell > 0:
-                    r, c = row + i, col + j
-                    if r >= len(self.grid) or c < 0 or c >= len(self.grid[0]) or self.grid[r][c]:
-                        return False
-        return True
+        _, max_row, min_col, max_col = self._bounds[rotation]
+        if row + max_row >= self._height or col + min_col < 0 or col + max_col >= self._width:
+            return False
+        # The generated test ANDs each shape row bitmask against the grid, unrolled
+        return self._fit[rotation](self.grid, row, col)
 
     def get_current_shape(self):
         """
@@ -103,4 +123,22 @@ class Tetrimino:
         Returns:
             list of list of int: The 2D matrix for the current rotation.
         """
-        return self.rotations[self.rotation][0]  # Return the current rotation shape
+        return self._shape
+
+    def get_current_cells(self):
+        """
+        Get the occupied cells of the current rotation of the Tetrimino.
+
+        Returns:
+            tuple of tuple of int: The (row offset, column offset, value) of each block.
+        """
+        return self._cells
+
+    def get_current_rows(self):
+        """
+        Get the occupancy bitmasks of the rows of the current rotation of the Tetrimino.
+
+        Returns:
+            tuple of tuple of int: The (row offset, bitmask) of each occupied row, with bit c set for column offset c.
+        """
+        return self._rows
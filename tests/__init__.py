@@ -1,5 +1,10 @@
+import os
 import unittest
 
+# Run pygame headless, so the tests never probe for a real display or audio device
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
 def load_tests(loader, standard_tests, pattern):
     """ Load all tests in the tests directory """
     package_tests = loader.discover(start_dir='.', pattern='test_*.py')
@@ -27,6 +27,21 @@ from src.display import Display
 import src.settings as settings
 
 class TestDisplay(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        """Initialize Pygame once for all Display tests.
+
+        Only the display module is needed, and a video mode is set because cached
+        surfaces are converted to the display format.
+        """
+        pygame.display.init()
+        pygame.display.set_mode((settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT))
+
+    @classmethod
+    def tearDownClass(cls):
+        """Shut Pygame down after the last Display test."""
+        pygame.quit()
+
     def setUp(self):
         """Prepare environment for testing Display methods.
 
@@ -34,14 +49,13 @@ class TestDisplay(unittest.TestCase):
         screen size and font rendering, which are crucial for Display functionality but
         impractical in a headless test environment.
         """
-        pygame.init()
-        self.addCleanup(pygame.quit)
         self.mock_screen = Mock()
         self.mock_screen.get_width.return_value = 800
         self.mock_screen.get_height.return_value = 600
 
         self.mock_font = Mock()
         self.mock_text_surface = Mock()
+        self.mock_text_surface.convert_alpha.return_value = self.mock_text_surface
         self.mock_font.render = Mock(return_value=self.mock_text_surface)
 
         with patch('pygame.font.Font', return_value=self.mock_font):
@@ -64,17 +78,103 @@ class TestDisplay(unittest.TestCase):
         """
         mock_grid = [[0]*10 for _ in range(20)]
         mock_tetrimino = Mock()
-        mock_tetrimino.get_current_shape.return_value = [[1]]
-        mock_tetrimino.position = [5, 5]
+        mock_tetrimino.get_current_cells.return_value = ((0, 0, 1),)
+        mock_tetrimino.row = 5
+        mock_tetrimino.col = 5
 
         with patch('pygame.draw.rect'), patch('pygame.Rect'):
             self.display.render(mock_grid, 100, mock_tetrimino, 2, False)
         calls = [
-            unittest.mock.call("Score: 100", True, settings.WHITE),
-            unittest.mock.call("Level: 2", True, settings.WHITE)
+            unittest.mock.call("Score: 100", settings.HUD_ANTIALIAS, settings.WHITE),
+            unittest.mock.call("Level: 2", settings.HUD_ANTIALIAS, settings.WHITE)
         ]
         self.mock_font.render.assert_has_calls(calls, any_order=True)
 
+    def test_render_caches_text(self):
+        """Test that score and level texts are only rasterized when they change.
+
+        Rendering the same score and level twice should reuse the cached surfaces,
+        while a new score should be rendered once.
+        """
+        mock_grid = [[0]*10 for _ in range(20)]
+
+        with patch('pygame.draw.rect'):
+            self.display.render(mock_grid, 100, None, 2, False)
+            self.display.render(mock_grid, 100, None, 2, False)
+            self.display.render(mock_grid, 101, None, 2, False)
+        rendered = [c.args[0] for c in self.mock_font.render.call_args_list]
+        self.assertEqual(rendered.count("Score: 100"), 1)
+        self.assertEqual(rendered.count("Score: 101"), 1)
+        self.assertEqual(rendered.count("Level: 2"), 1)
+
+    def test_render_skips_empty_cells(self):
+        """Test that render only draws occupied cells.
+
+        The empty grid is pre-rendered into the background surface, so only the
+        occupied cell should be blitted on top of it.
+        """
+        mock_grid = [[0]*10 for _ in range(20)]
+        mock_grid[-1][0] = 1
+
+        self.display.render(mock_grid, 0, None, 1, False)
+        cell_blits = [c for c in self.mock_screen.blit.call_args_list if c.args[0] in self.display.cell_surfs]
+        self.mock_screen.blit.assert_any_call(self.display.bg, (0, 0))
+        self.assertEqual(len(cell_blits), 1, "Only the occupied cell should be drawn.")
+        self.assertEqual(cell_blits[0].args, (self.display.cell_surfs[0], self.display.cell_rects[-1][0]))
+
+    def test_render_only_changed_cells(self):
+        """Test that render only redraws the cells that changed since the previous frame.
+
+        The first frame is redrawn completely, after which moving the tetrimino should only
+        report the cells it left and the cells it moved into as dirty.
+        """
+        self.mock_font.render = Mock(return_value=pygame.Surface((10, 10), pygame.SRCALPHA))
+        mock_grid = [[0]*10 for _ in range(20)]
+        mock_tetrimino = Mock()
+        mock_tetrimino.get_current_cells.return_value = ((0, 0, 1), (0, 1, 1))
+        mock_tetrimino.row = 5
+        mock_tetrimino.col = 5
+
+        with patch('pygame.draw.rect'):
+            self.display.render(mock_grid, 0, mock_tetrimino, 1, False)
+            mock_tetrimino.row = 5
+            mock_tetrimino.col = 6
+            dirty = self.display.render(mock_grid, 0, mock_tetrimino, 1, False)
+            unchanged = self.display.render(mock_grid, 0, mock_tetrimino, 1, False)
+
+        cell_rects = self.display.cell_rects
+        self.assertCountEqual(dirty, [cell_rects[5][5], cell_rects[5][7]])
+        self.assertEqual(unchanged, [], "Nothing should be redrawn when nothing changed.")
+
+    def test_render_merges_tetrimino_rows(self):
+        """Test that a row of the active tetrimino is drawn as a single rectangle.
+
+        A horizontal tetrimino covering four cells should be filled with one call spanning
+        all four cells instead of one call per cell.
+        """
+        mock_grid = [[0]*10 for _ in range(20)]
+        mock_tetrimino = Mock()
+        mock_tetrimino.get_current_cells.return_value = ((0, 0, 1), (0, 1, 1), (0, 2, 1), (0, 3, 1))
+        mock_tetrimino.row = 10
+        mock_tetrimino.col = 3
+
+        self.display.render(mock_grid, 0, mock_tetrimino, 1, False)
+        cell_rects = self.display.cell_rects
+        self.mock_screen.fill.assert_called_once_with(settings.COLORS[0], cell_rects[10][3].union(cell_rects[10][6]))
+
+    def test_invalidate(self):
+        """Test that invalidating the display makes the next render redraw the whole screen.
+
+        After an unchanged frame produces no dirty areas, invalidate should cause the same
+        frame to be redrawn in full, as the window contents may have been lost.
+        """
+        mock_grid = [[0]*10 for _ in range(20)]
+        self.display.render(mock_grid, 0, None, 1, True)
+        self.assertEqual(self.display.render(mock_grid, 0, None, 1, True), [])
+
+        self.display.invalidate()
+        self.assertEqual(self.display.render(mock_grid, 0, None, 1, True), [self.mock_screen.get_rect.return_value])
+
     def test_show_paused(self):
         """Test the display of the 'Paused' text during game pause.
 
@@ -24,6 +24,8 @@ import unittest
 from unittest.mock import Mock, patch
 from src.game_logic import GameLogic
 from src.tetrimino import Tetrimino
+from src.input_handler import ROTATE
+import src.settings as settings
 
 class TestGameLogic(unittest.TestCase):
     def setUp(self):
@@ -58,6 +60,7 @@ class TestGameLogic(unittest.TestCase):
         It checks that the score is increased and the line clearing sound is played exactly once.
         """
         self.game_logic.grid[-1] = [1] * len(self.game_logic.grid[0])
+        self.game_logic.row_masks[-1] = settings.FULL_ROW_MASK
         self.game_logic.clear_lines()
         self.mock_break_line_sound.play.assert_called_once()
         self.assertGreater(self.game_logic.score, 0, "Score should increase when a line is cleared.")
@@ -74,6 +77,23 @@ class TestGameLogic(unittest.TestCase):
         self.game_logic.toggle_pause()
         self.assertFalse(self.game_logic.is_paused, "Toggling pause again should resume the game.")
 
+    def test_dirty_flag(self):
+        """
+        Tests that state changes mark the game as needing to be rendered again.
+        """
+        self.game_logic.dirty = False
+        self.game_logic.update(1, 0)
+        self.assertFalse(self.game_logic.dirty, "Nothing should change before the drop interval elapses.")
+        self.game_logic.toggle_pause()
+        self.assertTrue(self.game_logic.dirty, "Pausing should require a new render.")
+        self.game_logic.toggle_pause()
+        self.game_logic.dirty = False
+        self.mock_tetrimino.can_fit.return_value = True
+        self.mock_tetrimino.row = 0
+        self.mock_tetrimino.col = 4
+        self.game_logic.update(self.game_logic.drop_speed + 1, 0)
+        self.assertTrue(self.game_logic.dirty, "Dropping the tetrimino should require a new render.")
+
     def test_reset_game(self):
         """
         Tests the reset functionality of the game to ensure it returns to its initial state.
@@ -97,10 +117,70 @@ class TestGameLogic(unittest.TestCase):
         # Setup two consecutive full lines at the bottom of the grid.
         for i in range(-2, 0):
             self.game_logic.grid[i] = [1] * len(self.game_logic.grid[0])
+            self.game_logic.row_masks[i] = settings.FULL_ROW_MASK
         self.game_logic.clear_lines()
         self.mock_break_line_sound.play.assert_called_once()
         expected_score_increase = 4  # Example score logic: score per line squared (2 lines -> 2^2 = 4)
         self.assertEqual(self.game_logic.score, expected_score_increase, "Score should correctly reflect multiple lines cleared.")
 
+    def test_clear_lines_shifts_rows_down(self):
+        """
+        Tests that rows above a cleared line move down and the grid is updated in place.
+
+        The grid object must stay the same so that references held elsewhere remain valid.
+        """
+        grid = self.game_logic.grid
+        width = len(grid[0])
+        row_masks = self.game_logic.row_masks
+        grid[-2] = [1] + [0] * (width - 1)
+        row_masks[-2] = 1
+        grid[-1] = [1] * width
+        row_masks[-1] = settings.FULL_ROW_MASK
+        self.game_logic.clear_lines()
+        self.assertIs(self.game_logic.grid, grid, "Grid should be updated in place.")
+        self.assertIs(self.game_logic.row_masks, row_masks, "Row masks should be updated in place.")
+        self.assertEqual(grid[-1], [1] + [0] * (width - 1), "Partial row should drop into the cleared line.")
+        self.assertEqual(row_masks[-1], 1, "Row masks should move down together with the grid.")
+        self.assertEqual(grid[0], [0] * width, "An empty row should be inserted at the top.")
+        self.assertEqual(row_masks[0], 0)
+
+    def test_place_tetrimino_updates_row_masks(self):
+        """
+        Tests that placing a tetrimino marks its cells in both the grid and the row bitmasks.
+        """
+        self.game_logic.current_tetrimino = Tetrimino('O', self.game_logic.row_masks)
+        self.game_logic.current_tetrimino.row = 18
+        self.game_logic.current_tetrimino.col = 0
+        self.game_logic.place_tetrimino()
+        self.assertEqual(self.game_logic.grid[18][:2], [2, 2])
+        self.assertEqual(self.game_logic.row_masks[18], 0b11)
+        self.assertEqual(self.game_logic.row_masks[19], 0b11)
+
+    def test_rotation_cooldown(self):
+        """
+        Tests that rotations are limited by the rotation delay.
+
+        Holding rotate should only rotate again once the rotation delay has elapsed.
+        """
+        self.mock_tetrimino.rotate.return_value = True
+        commands = ROTATE
+        self.game_logic.rotation_cooldown = 0
+        step = 50
+        for _ in range(self.game_logic.rotation_delay // step + 1):
+            self.game_logic.handle_rotation(step, commands)
+        self.assertEqual(self.mock_tetrimino.rotate.call_count, 1, "Rotation should wait for the rotation delay.")
+        self.game_logic.handle_rotation(step, commands)
+        self.assertEqual(self.mock_tetrimino.rotate.call_count, 2)
+        self.mock_tetrimino.rotate.assert_called_with(self.mock_rotate_sound)
+
+    def test_new_tetrimino_bag(self):
+        """
+        Tests that each run of seven new tetriminos contains every tetrimino type exactly once.
+        """
+        self.game_logic.bag = []
+        for _ in range(2):
+            shape_ids = [self.game_logic.new_tetrimino().shape_id for _ in range(len(settings.TETRIMINOS))]
+            self.assertCountEqual(shape_ids, range(len(settings.SHAPE_NAMES)))
+
 if __name__ == '__main__':
     unittest.main()
@@ -22,7 +22,7 @@ SOFTWARE.
 
 import unittest
 from unittest.mock import Mock, patch
-from src.input_handler import InputHandler
+from src.input_handler import InputHandler, MOVE_LEFT, MOVE_RIGHT
 import pygame
 
 class TestInputHandler(unittest.TestCase):
@@ -47,8 +47,8 @@ class TestInputHandler(unittest.TestCase):
                 self.input_handler.process_event(event)
 
             # Check if the correct commands are set based on the events
-            self.assertTrue('move_left' in self.input_handler.commands, "Left arrow key should trigger move_left command.")
-            self.assertFalse('move_right' in self.input_handler.commands, "Right arrow key should not remain active after key up.")
+            self.assertTrue(self.input_handler.commands & MOVE_LEFT, "Left arrow key should trigger move_left command.")
+            self.assertFalse(self.input_handler.commands & MOVE_RIGHT, "Right arrow key should not remain active after key up.")
 
 if __name__ == '__main__':
     unittest.main()
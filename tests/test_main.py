@@ -0,0 +1,64 @@
+"""
+Copyright (c) 2024 Adam Billekvist
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import unittest
+from unittest.mock import Mock, patch
+import pygame
+import main
+from src.settings import FPS, MENU_COLOR_INTERVAL
+
+class TestMain(unittest.TestCase):
+    def test_show_menu_recolors_highscore(self):
+        """Test that the menu re-colors the highscore letters every MENU_COLOR_INTERVAL milliseconds.
+
+        The menu is stepped through a series of frames with a clock that advances a fixed
+        amount per tick, then started with the S key. The letters should be re-rendered on
+        the first frame and whenever MENU_COLOR_INTERVAL has elapsed since the last time.
+        """
+        frame_time = 40
+        frames = 7
+        mock_clock = Mock()
+        mock_clock.tick.return_value = frame_time
+        mock_font = Mock()
+        mock_font.size.return_value = (10, 10)
+        mock_highscore_manager = Mock()
+        mock_highscore_manager.get_highscore.return_value = 5
+        events = [[]] * (frames - 1) + [[pygame.event.Event(pygame.KEYDOWN, key=pygame.K_s)]]
+
+        with patch('pygame.time.Clock', return_value=mock_clock), \
+             patch('pygame.font.Font', return_value=mock_font), \
+             patch('pygame.event.get', side_effect=events), \
+             patch('pygame.display.flip'), \
+             patch('main.main_game') as mock_main_game:
+            main.show_menu(Mock(), None, None, None, mock_highscore_manager)
+
+        mock_clock.tick.assert_called_with(FPS)
+        self.assertEqual(mock_clock.tick.call_count, frames)
+        # Re-colored on the first frame, then on every frame where another 100 ms have elapsed: frames 1, 4 and 7
+        self.assertEqual(MENU_COLOR_INTERVAL, 100)
+        recolors = 3
+        char_renders = [c for c in mock_font.render.call_args_list if len(c.args[0]) == 1]
+        self.assertEqual(len(char_renders), recolors * len("Highscore: 5"))
+        mock_main_game.assert_called_once()
+
+if __name__ == '__main__':
+    unittest.main()
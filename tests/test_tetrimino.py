@@ -20,9 +20,11 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
+import random
 import unittest
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 from src.tetrimino import Tetrimino
+import src.settings as settings
 
 class TestTetrimino(unittest.TestCase):
     def setUp(self):
@@ -33,8 +35,8 @@ class TestTetrimino(unittest.TestCase):
         the game's playing field. A mock for the rotation sound effect is also created
         to verify interaction with the sound system during rotation.
         """
-        # Prepare a 10x20 grid of zeros representing an empty Tetris field.
-        self.grid = [[0]*10 for _ in range(20)]
+        # Prepare 20 empty row bitmasks representing an empty 10x20 Tetris field.
+        self.grid = [0]*20
         
         # Initialize a Tetrimino with shape 'I' (a straight line) in the grid.
         self.tetrimino = Tetrimino('I', self.grid)
@@ -47,52 +49,99 @@ class TestTetrimino(unittest.TestCase):
         Test successful rotation of a Tetrimino.
 
         Verifies that the Tetrimino's rotation attribute updates correctly when
-        the rotation is successful, i.e., sufficient time has passed according to
-        the rotation delay and the rotation does not result in a collision.
+        the rotation does not result in a collision.
         """
-        current_time = 1000
-        last_rotation_time = 800  # earlier than current_time - rotation_delay
-        rotation_delay = 150
-        
         # Store initial rotation state to compare after attempting rotation.
         initial_rotation = self.tetrimino.rotation
-        
-        # Simulate passage of time using a mock for pygame's time function.
-        with patch('pygame.time.get_ticks', return_value=current_time):
-            result_time = self.tetrimino.rotate(current_time, last_rotation_time, rotation_delay, self.mock_rotate_sound)
-        
-        # Check that rotation time is updated to current time on success.
-        self.assertEqual(result_time, current_time, "Rotation time should update on successful rotation.")
+
+        rotated = self.tetrimino.rotate(self.mock_rotate_sound)
+
+        # Check that the rotation is reported as successful.
+        self.assertTrue(rotated, "Rotation should succeed on an empty grid.")
         # Ensure the Tetrimino's rotation state has changed.
         self.assertNotEqual(self.tetrimino.rotation, initial_rotation, "Tetrimino rotation should change.")
         # Verify that the rotation sound was played once.
         self.mock_rotate_sound.play.assert_called_once()
+        # The cached shape and cells should follow the new rotation.
+        self.assertEqual(self.tetrimino.get_current_shape(), [[1, 1, 1, 1]])
+        self.assertEqual(self.tetrimino.get_current_cells(), ((0, 0, 1), (0, 1, 1), (0, 2, 1), (0, 3, 1)))
 
     def test_rotate_unsuccessful(self):
         """
-        Test unsuccessful rotation due to insufficient time passed.
+        Test unsuccessful rotation due to a collision.
 
-        Ensures that the Tetrimino's rotation does not update when not enough time
-        has passed since the last rotation, simulating a rapid attempt to rotate that
-        is below the allowed rotation speed threshold.
+        Ensures that the Tetrimino's rotation does not update when the next rotation
+        would overlap an occupied cell of the grid.
         """
-        current_time = 900
-        last_rotation_time = 800
-        rotation_delay = 150
-        
+        # Occupy the cell right of the vertical 'I', which the horizontal 'I' would cover.
+        self.grid[0] = 1 << 5
+
         # Store initial rotation state to confirm no change on failed rotation.
         initial_rotation = self.tetrimino.rotation
-        
-        # Simulate passage of time for the test.
-        with patch('pygame.time.get_ticks', return_value=current_time):
-            result_time = self.tetrimino.rotate(current_time, last_rotation_time, rotation_delay, self.mock_rotate_sound)
-        
-        # Ensure the rotation time remains unchanged on failed rotation attempt.
-        self.assertEqual(result_time, last_rotation_time, "Rotation time should not update on failed rotation.")
+
+        rotated = self.tetrimino.rotate(self.mock_rotate_sound)
+
+        # Ensure the rotation is reported as failed.
+        self.assertFalse(rotated, "Rotation should fail when blocked.")
         # Confirm no change in the Tetrimino's rotation state.
         self.assertEqual(self.tetrimino.rotation, initial_rotation, "Tetrimino rotation should not change.")
         # Ensure the rotation sound was not played.
         self.mock_rotate_sound.play.assert_not_called()
 
+    def test_can_fit(self):
+        """
+        Test collision checks against the grid row bitmasks.
+
+        Verifies that the Tetrimino fits on an empty grid, does not fit outside the
+        grid bounds, and does not fit on top of an occupied cell.
+        """
+        self.tetrimino.rotation = 1  # Horizontal 'I' spanning four columns
+        self.assertTrue(self.tetrimino.can_fit(0, 0))
+        self.assertTrue(self.tetrimino.can_fit(19, 6))
+        self.assertFalse(self.tetrimino.can_fit(0, -1), "Tetrimino should not fit left of the grid.")
+        self.assertFalse(self.tetrimino.can_fit(0, 7), "Tetrimino should not fit right of the grid.")
+        self.assertFalse(self.tetrimino.can_fit(20, 0), "Tetrimino should not fit below the grid.")
+
+        self.grid[5] = 1 << 3  # Occupy column 3 of row 5
+        self.assertFalse(self.tetrimino.can_fit(5, 0), "Tetrimino should not overlap an occupied cell.")
+        self.assertTrue(self.tetrimino.can_fit(5, 4))
+
+    def test_can_fit_matches_cell_scan(self):
+        """
+        Test that the generated collision tests agree with a cell-by-cell scan.
+
+        Every rotation of every shape is checked at every position of a randomly filled grid.
+        """
+        rng = random.Random(0)
+        grid = [rng.getrandbits(10) & rng.getrandbits(10) for _ in range(20)]
+        for shape in settings.TETRIMINOS:
+            tetrimino = Tetrimino(shape, grid)
+            for rotation, (matrix, _) in enumerate(tetrimino.rotations):
+                for row in range(22):
+                    for col in range(-4, 13):
+                        expected = all(
+                            0 <= row + i < 20 and 0 <= col + j < 10 and not grid[row + i] >> (col + j) & 1
+                            for i, line in enumerate(matrix) for j, cell in enumerate(line) if cell)
+                        self.assertEqual(tetrimino.can_fit(row, col, rotation), expected, (shape, rotation, row, col))
+
+    def test_shape_id(self):
+        """
+        Test that a Tetrimino can be created from either its shape identifier or its integer shape id.
+        """
+        for shape_id, shape in enumerate(settings.SHAPE_NAMES):
+            by_name = Tetrimino(shape, self.grid)
+            by_id = Tetrimino(shape_id, self.grid)
+            self.assertEqual((by_name.shape, by_name.shape_id), (shape, shape_id))
+            self.assertEqual((by_id.shape, by_id.shape_id), (shape, shape_id))
+            self.assertIs(by_id.rotations, settings.TETRIMINOS[shape]['rotations'])
+
+    def test_slots(self):
+        """
+        Test that a Tetrimino stores its attributes in slots rather than an instance dictionary.
+        """
+        self.assertFalse(hasattr(self.tetrimino, '__dict__'))
+        with self.assertRaises(AttributeError):
+            self.tetrimino.undeclared = True
+
 if __name__ == '__main__':
     unittest.main()